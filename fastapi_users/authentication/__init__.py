@@ -1,25 +1,61 @@
-import re
+import string
+from functools import lru_cache
 from inspect import Parameter, Signature
-from typing import Optional, Sequence
+from operator import attrgetter
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
 
 from fastapi import Depends, HTTPException, status
-from makefun import with_signature
 
 from fastapi_users.authentication.base import BaseAuthentication  # noqa: F401
 from fastapi_users.authentication.cookie import CookieAuthentication  # noqa: F401
 from fastapi_users.authentication.jwt import JWTAuthentication  # noqa: F401
+from fastapi_users.authentication.redis import (  # noqa: F401
+    RedisSessionAuthentication,
+)
 from fastapi_users.db import BaseUserDatabase
+from fastapi_users.db.loader import UserLoader
 from fastapi_users.models import BaseUserDB
 
-INVALID_CHARS_PATTERN = re.compile(r"[^0-9a-zA-Z_]")
-INVALID_LEADING_CHARS_PATTERN = re.compile(r"^[^a-zA-Z_]+")
+VALID_CHARS = frozenset(string.ascii_letters + string.digits + "_")
 
+UserValidator = Callable[[BaseUserDB], Tuple[Optional[BaseUserDB], int]]
 
+
+@lru_cache(maxsize=None)
 def name_to_variable_name(name: str) -> str:
     """Transform a backend name string into a string safe to use as variable name."""
-    name = re.sub(INVALID_CHARS_PATTERN, "", name)
-    name = re.sub(INVALID_LEADING_CHARS_PATTERN, "", name)
-    return name
+    name = "".join(char for char in name if char in VALID_CHARS)
+    # Once invalid chars are removed, only digits can't lead a variable name
+    return name.lstrip(string.digits)
+
+
+def get_user_validator(
+    active: bool = False, verified: bool = False, superuser: bool = False
+) -> UserValidator:
+    """
+    Return a function checking an authenticated user against the requirements.
+
+    It returns the user, or `None` if it doesn't pass the requirements,
+    along with the status code to use if there is no user.
+    """
+    checks: List[Tuple[Callable[[BaseUserDB], bool], int]] = []
+    if active:
+        checks.append((attrgetter("is_active"), status.HTTP_401_UNAUTHORIZED))
+    if verified:
+        checks.append((attrgetter("is_verified"), status.HTTP_403_FORBIDDEN))
+    if superuser:
+        checks.append((attrgetter("is_superuser"), status.HTTP_403_FORBIDDEN))
+
+    if not checks:
+        return lambda user: (user, status.HTTP_403_FORBIDDEN)
+
+    def validate_user(user: BaseUserDB) -> Tuple[Optional[BaseUserDB], int]:
+        for check, status_code in checks:
+            if not check(user):
+                return None, status_code
+        return user, status.HTTP_403_FORBIDDEN
+
+    return validate_user
 
 
 class DuplicateBackendNamesError(Exception):
@@ -36,16 +72,49 @@ class Authenticator:
 
     :param backends: List of authentication backends.
     :param user_db: Database adapter instance.
+    :param user_cache_seconds: Duration in seconds during which an authenticated user
+    is kept in memory. The cache is local to the process. Defaults to `0` (disabled).
     """
 
     backends: Sequence[BaseAuthentication]
     user_db: BaseUserDatabase
+    user_loader: UserLoader
+    _backend_var_names: List[str]
+    _signature: Signature
+    _dependencies: Dict[Tuple[bool, bool, bool, bool], Callable]
+    _get_user: Callable[[Sequence[Optional[str]]], Awaitable[Optional[BaseUserDB]]]
 
     def __init__(
-        self, backends: Sequence[BaseAuthentication], user_db: BaseUserDatabase
+        self,
+        backends: Sequence[BaseAuthentication],
+        user_db: BaseUserDatabase,
+        user_cache_seconds: int = 0,
     ):
         self.backends = backends
         self.user_db = user_db
+        # Backends retrieve the users through the loader
+        self.user_loader = UserLoader(user_db, cache_seconds=user_cache_seconds)
+        self._backend_var_names = [
+            name_to_variable_name(backend.name) for backend in backends
+        ]
+        if len(set(self._backend_var_names)) != len(self._backend_var_names):
+            raise DuplicateBackendNamesError()
+        self._signature = Signature(
+            [
+                Parameter(
+                    name=var_name,
+                    kind=Parameter.POSITIONAL_OR_KEYWORD,
+                    default=Depends(backend.scheme),  # type: ignore
+                )
+                for backend, var_name in zip(backends, self._backend_var_names)
+            ]
+        )
+        self._dependencies = {}
+        # Most applications have a single backend: skip the loop in this case
+        if len(backends) == 1:
+            self._get_user = self._get_user_from_single_backend
+        else:
+            self._get_user = self._get_user_from_backends
 
     def current_user(
         self,
@@ -68,64 +137,59 @@ class Authenticator:
         :param superuser: If `True`, throw `403 Forbidden` if
         the authenticated user is not a superuser. Defaults to `False`.
         """
+        key = (optional, active, verified, superuser)
+        if key in self._dependencies:
+            return self._dependencies[key]
+
         # Here comes some blood magic 🧙‍♂️
-        # Thank to "makefun", we are able to generate callable
+        # By overriding its signature, we are able to generate callable
         # with a dynamic number of dependencies at runtime.
         # This way, each security schemes are detected by the OpenAPI generator.
-        try:
-            parameters = [
-                Parameter(
-                    name=name_to_variable_name(backend.name),
-                    kind=Parameter.POSITIONAL_OR_KEYWORD,
-                    default=Depends(backend.scheme),  # type: ignore
-                )
-                for backend in self.backends
-            ]
-            signature = Signature(parameters)
-        except ValueError:
-            raise DuplicateBackendNamesError()
+        validate_user = get_user_validator(active, verified, superuser)
+        var_names = self._backend_var_names
 
-        @with_signature(signature)
-        async def current_user_dependency(*args, **kwargs):
+        async def current_user_dependency(**kwargs):
+            # Tokens are passed in the same order as the backends
             return await self._authenticate(
-                *args,
+                tuple(kwargs[var_name] for var_name in var_names),
                 optional=optional,
-                active=active,
-                verified=verified,
-                superuser=superuser,
-                **kwargs
+                validate_user=validate_user,
             )
 
+        current_user_dependency.__signature__ = self._signature  # type: ignore
+        self._dependencies[key] = current_user_dependency
         return current_user_dependency
 
     async def _authenticate(
         self,
-        *args,
+        tokens: Sequence[Optional[str]],
         optional: bool = False,
-        active: bool = False,
-        verified: bool = False,
-        superuser: bool = False,
-        **kwargs
+        validate_user: UserValidator = get_user_validator(),
     ) -> Optional[BaseUserDB]:
-        user: Optional[BaseUserDB] = None
-        for backend in self.backends:
-            token: str = kwargs[name_to_variable_name(backend.name)]
-            if token:
-                user = await backend(token, self.user_db)
-                if user:
-                    break
+        user = await self._get_user(tokens)
 
         status_code = status.HTTP_401_UNAUTHORIZED
         if user:
-            status_code = status.HTTP_403_FORBIDDEN
-            if active and not user.is_active:
-                status_code = status.HTTP_401_UNAUTHORIZED
-                user = None
-            elif verified and not user.is_verified:
-                user = None
-            elif superuser and not user.is_superuser:
-                user = None
+            user, status_code = validate_user(user)
 
         if not user and not optional:
             raise HTTPException(status_code=status_code)
         return user
+
+    async def _get_user_from_backends(
+        self, tokens: Sequence[Optional[str]]
+    ) -> Optional[BaseUserDB]:
+        for backend, token in zip(self.backends, tokens):
+            if token:
+                user = await backend(token, self.user_loader)
+                if user:
+                    return user
+        return None
+
+    async def _get_user_from_single_backend(
+        self, tokens: Sequence[Optional[str]]
+    ) -> Optional[BaseUserDB]:
+        token = tokens[0]
+        if token:
+            return await self.backends[0](token, self.user_loader)
+        return None
@@ -1,4 +1,6 @@
-from typing import Any, List, Optional
+import time
+from hashlib import blake2b
+from typing import Any, Dict, List, Optional
 
 import jwt
 from fastapi import Response
@@ -6,38 +8,138 @@ from fastapi.security import APIKeyCookie
 from pydantic import UUID4
 
 from fastapi_users.authentication import BaseAuthentication
+from fastapi_users.cache import TTLCache
 from fastapi_users.db.base import BaseUserDatabase
-from fastapi_users.jwt import SecretType, decode_jwt, generate_jwt
+from fastapi_users.jwt import (
+    JWT_ALGORITHM,
+    JWTDecoder,
+    SecretType,
+    generate_jwt,
+    get_secret_value,
+)
 from fastapi_users.models import BaseUserDB
 
 
-class CookieAuthentication(BaseAuthentication[str]):
+class BaseCookieAuthentication(BaseAuthentication[str]):
+    """
+    Base authentication backend transporting a token in a cookie.
+
+    Subclasses generate the token and retrieve the user from it.
+
+    :param name: Name of the backend. It will be used to name the login route.
+    :param lifetime_seconds: Lifetime duration of the cookie in seconds.
+    :param cookie_name: Name of the cookie. It's read-only.
+    :param cookie_path: Cookie path. It's read-only.
+    :param cookie_domain: Cookie domain. It's read-only.
+    :param cookie_secure: Whether to only send the cookie to the server via SSL request.
+    It's read-only.
+    :param cookie_httponly: Whether to prevent access to the cookie via JavaScript.
+    It's read-only.
+    :param cookie_samesite: SameSite strategy of the cookie. It's read-only.
+    """
+
+    scheme: APIKeyCookie
+    lifetime_seconds: Optional[int]
+    _cookie_name: str
+    _cookie_kwargs: Dict[str, Any]
+
+    def __init__(
+        self,
+        name: str,
+        lifetime_seconds: Optional[int],
+        cookie_name: str,
+        cookie_path: str = "/",
+        cookie_domain: Optional[str] = None,
+        cookie_secure: bool = True,
+        cookie_httponly: bool = True,
+        cookie_samesite: str = "lax",
+    ):
+        super().__init__(name, logout=True)
+        self.lifetime_seconds = lifetime_seconds
+        self._cookie_name = cookie_name
+        self.scheme = APIKeyCookie(name=cookie_name, auto_error=False)
+        self._cookie_kwargs = {
+            "path": cookie_path,
+            "domain": cookie_domain,
+            "secure": cookie_secure,
+            "httponly": cookie_httponly,
+            "samesite": cookie_samesite,
+        }
+
+    # Cookie parameters are prepared once, so they can't be reassigned
+    @property
+    def cookie_name(self) -> str:
+        return self._cookie_name
+
+    @property
+    def cookie_path(self) -> str:
+        return self._cookie_kwargs["path"]
+
+    @property
+    def cookie_domain(self) -> Optional[str]:
+        return self._cookie_kwargs["domain"]
+
+    @property
+    def cookie_secure(self) -> bool:
+        return self._cookie_kwargs["secure"]
+
+    @property
+    def cookie_httponly(self) -> bool:
+        return self._cookie_kwargs["httponly"]
+
+    @property
+    def cookie_samesite(self) -> str:
+        return self._cookie_kwargs["samesite"]
+
+    async def get_login_response(self, user: BaseUserDB, response: Response) -> Any:
+        token = await self._generate_token(user)
+        response.set_cookie(
+            self.cookie_name,
+            token,
+            max_age=self.lifetime_seconds,
+            **self._cookie_kwargs,
+        )
+
+        # We shouldn't return directly the response
+        # so that FastAPI can terminate it properly
+        return None
+
+    async def get_logout_response(self, user: BaseUserDB, response: Response) -> Any:
+        response.delete_cookie(
+            self.cookie_name, path=self.cookie_path, domain=self.cookie_domain
+        )
+
+    async def _generate_token(self, user: BaseUserDB) -> str:
+        raise NotImplementedError()
+
+
+class CookieAuthentication(BaseCookieAuthentication):
     """
     Authentication backend using a cookie.
 
     Internally, uses a JWT token to store the data.
 
-    :param secret: Secret used to encode the cookie.
+    :param secret: Secret used to encode the cookie. It's read-only.
     :param lifetime_seconds: Lifetime duration of the cookie in seconds.
-    :param cookie_name: Name of the cookie.
-    :param cookie_path: Cookie path.
-    :param cookie_domain: Cookie domain.
+    :param cookie_name: Name of the cookie. It's read-only.
+    :param cookie_path: Cookie path. It's read-only.
+    :param cookie_domain: Cookie domain. It's read-only.
     :param cookie_secure: Whether to only send the cookie to the server via SSL request.
+    It's read-only.
     :param cookie_httponly: Whether to prevent access to the cookie via JavaScript.
+    It's read-only.
     :param name: Name of the backend. It will be used to name the login route.
     :param token_audience: List of valid audiences for the JWT.
+    :param token_cache_seconds: Duration during which a verified cookie
+    is trusted without decoding it again. Set to `0` to disable the cache.
+    :param token_cache_size: Maximum number of verified cookies kept in the cache.
     """
 
-    scheme: APIKeyCookie
     token_audience: List[str]
-    secret: SecretType
-    lifetime_seconds: Optional[int]
-    cookie_name: str
-    cookie_path: str
-    cookie_domain: Optional[str]
-    cookie_secure: bool
-    cookie_httponly: bool
-    cookie_samesite: str
+    _token_cache: TTLCache[bytes, UUID4]
+    _jwt: JWTDecoder
+    _secret: SecretType
+    _jwt_key: str
 
     def __init__(
         self,
@@ -51,18 +153,29 @@ class CookieAuthentication(BaseAuthentication[str]):
         cookie_samesite: str = "lax",
         name: str = "cookie",
         token_audience: List[str] = ["fastapi-users:auth"],
+        token_cache_seconds: int = 10,
+        token_cache_size: int = 1024,
     ):
-        super().__init__(name, logout=True)
-        self.secret = secret
-        self.lifetime_seconds = lifetime_seconds
-        self.cookie_name = cookie_name
-        self.cookie_path = cookie_path
-        self.cookie_domain = cookie_domain
-        self.cookie_secure = cookie_secure
-        self.cookie_httponly = cookie_httponly
-        self.cookie_samesite = cookie_samesite
+        super().__init__(
+            name,
+            lifetime_seconds,
+            cookie_name,
+            cookie_path=cookie_path,
+            cookie_domain=cookie_domain,
+            cookie_secure=cookie_secure,
+            cookie_httponly=cookie_httponly,
+            cookie_samesite=cookie_samesite,
+        )
+        self._secret = secret
         self.token_audience = token_audience
-        self.scheme = APIKeyCookie(name=self.cookie_name, auto_error=False)
+        self._token_cache = TTLCache(token_cache_size, token_cache_seconds)
+        self._jwt = JWTDecoder()
+        self._jwt_key = get_secret_value(secret)
+
+    @property
+    def secret(self) -> SecretType:
+        # The decoding key is derived from it once, so it can't be reassigned
+        return self._secret
 
     async def __call__(
         self,
@@ -72,41 +185,46 @@ class CookieAuthentication(BaseAuthentication[str]):
         if credentials is None:
             return None
 
-        try:
-            data = decode_jwt(credentials, self.secret, self.token_audience)
-            user_id = data.get("user_id")
-            if user_id is None:
+        # Only keep a digest of the token in memory, not the token itself
+        token_key = blake2b(credentials.encode(), digest_size=16).digest()
+        user_uiid = self._token_cache.get(token_key)
+        if user_uiid is None:
+            try:
+                data = self._jwt.decode(
+                    credentials,
+                    self._jwt_key,
+                    audience=self.token_audience,
+                    algorithms=[JWT_ALGORITHM],
+                )
+                user_id = data.get("user_id")
+                if user_id is None:
+                    return None
+            except jwt.PyJWTError:
                 return None
-        except jwt.PyJWTError:
-            return None
+
+            try:
+                user_uiid = UUID4(user_id)
+            except ValueError:
+                return None
+            self._token_cache.set(token_key, user_uiid, self._get_cache_ttl(data))
 
         try:
-            user_uiid = UUID4(user_id)
             return await user_db.get(user_uiid)
         except ValueError:
             return None
 
-    async def get_login_response(self, user: BaseUserDB, response: Response) -> Any:
-        token = await self._generate_token(user)
-        response.set_cookie(
-            self.cookie_name,
-            token,
-            max_age=self.lifetime_seconds,
-            path=self.cookie_path,
-            domain=self.cookie_domain,
-            secure=self.cookie_secure,
-            httponly=self.cookie_httponly,
-            samesite=self.cookie_samesite,
-        )
-
-        # We shouldn't return directly the response
-        # so that FastAPI can terminate it properly
-        return None
-
     async def get_logout_response(self, user: BaseUserDB, response: Response) -> Any:
-        response.delete_cookie(
-            self.cookie_name, path=self.cookie_path, domain=self.cookie_domain
-        )
+        # The raw token isn't available here: forget every token of this user
+        self._token_cache.remove_value(user.id)
+        return await super().get_logout_response(user, response)
+
+    def _get_cache_ttl(self, data: Dict[str, Any]) -> Optional[float]:
+        # A verified token is trusted for the cache duration,
+        # but never beyond its own expiration
+        expire = data.get("exp")
+        if expire is None:
+            return None
+        return expire - time.time()
 
     async def _generate_token(self, user: BaseUserDB) -> str:
         data = {"user_id": str(user.id), "aud": self.token_audience}
@@ -0,0 +1,119 @@
+import secrets
+import time
+from typing import Any, Optional
+
+from fastapi import Response
+from pydantic import UUID4
+
+from fastapi_users.authentication.cookie import BaseCookieAuthentication
+from fastapi_users.db.base import BaseUserDatabase
+from fastapi_users.models import BaseUserDB
+
+
+class RedisSessionAuthentication(BaseCookieAuthentication):
+    """
+    Authentication backend using a session cookie stored in Redis.
+
+    The cookie only contains a random session id,
+    mapped to the user id in Redis. The sessions of each user are listed
+    in a sorted set, scored by their expiration.
+
+    :param redis: Asyncio Redis client, e.g. from `aioredis` or `redis.asyncio`.
+    :param lifetime_seconds: Lifetime duration of the session in seconds.
+    :param cookie_name: Name of the cookie. It's read-only.
+    :param cookie_path: Cookie path. It's read-only.
+    :param cookie_domain: Cookie domain. It's read-only.
+    :param cookie_secure: Whether to only send the cookie to the server via SSL request.
+    It's read-only.
+    :param cookie_httponly: Whether to prevent access to the cookie via JavaScript.
+    It's read-only.
+    :param name: Name of the backend. It will be used to name the login route.
+    :param key_prefix: Prefix of the keys stored in Redis.
+    Sessions and users are stored under the `session:` and `user:` sub-prefixes.
+    """
+
+    redis: Any
+    lifetime_seconds: int
+    key_prefix: str
+
+    def __init__(
+        self,
+        redis: Any,
+        lifetime_seconds: int,
+        cookie_name: str = "fastapiuserssession",
+        cookie_path: str = "/",
+        cookie_domain: Optional[str] = None,
+        cookie_secure: bool = True,
+        cookie_httponly: bool = True,
+        cookie_samesite: str = "lax",
+        name: str = "redis",
+        key_prefix: str = "fastapi_users:",
+    ):
+        super().__init__(
+            name,
+            lifetime_seconds,
+            cookie_name,
+            cookie_path=cookie_path,
+            cookie_domain=cookie_domain,
+            cookie_secure=cookie_secure,
+            cookie_httponly=cookie_httponly,
+            cookie_samesite=cookie_samesite,
+        )
+        self.redis = redis
+        self.key_prefix = key_prefix
+
+    async def __call__(
+        self,
+        credentials: Optional[str],
+        user_db: BaseUserDatabase,
+    ) -> Optional[BaseUserDB]:
+        if credentials is None:
+            return None
+
+        user_id = await self.redis.get(self._get_session_key(credentials))
+        if user_id is None:
+            return None
+        if isinstance(user_id, bytes):
+            user_id = user_id.decode()
+
+        try:
+            user_uuid = UUID4(user_id)
+            return await user_db.get(user_uuid)
+        except ValueError:
+            return None
+
+    async def get_logout_response(self, user: BaseUserDB, response: Response) -> Any:
+        # The session id isn't available here: revoke every session of the user
+        user_key = self._get_user_key(user)
+        session_ids = await self.redis.zrange(user_key, 0, -1)
+        await self.redis.delete(
+            user_key, *(self._get_session_key(session_id) for session_id in session_ids)
+        )
+        return await super().get_logout_response(user, response)
+
+    async def _generate_token(self, user: BaseUserDB) -> str:
+        token = secrets.token_urlsafe(32)
+        user_key = self._get_user_key(user)
+        now = time.time()
+        # Store the session and track it in a single transaction,
+        # so it can't be left out of the sessions revoked on logout
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.setex(
+                self._get_session_key(token), self.lifetime_seconds, str(user.id)
+            )
+            # Forget expired sessions, so the set doesn't grow on each login
+            pipe.zremrangebyscore(user_key, "-inf", now)
+            pipe.zadd(user_key, {token: now + self.lifetime_seconds})
+            pipe.expire(user_key, self.lifetime_seconds)
+            await pipe.execute()
+        return token
+
+    def _get_session_key(self, session_id: Any) -> str:
+        if isinstance(session_id, bytes):
+            session_id = session_id.decode()
+        # Sessions have their own namespace: a forged session id
+        # can't designate another kind of key
+        return f"{self.key_prefix}session:{session_id}"
+
+    def _get_user_key(self, user: BaseUserDB) -> str:
+        return f"{self.key_prefix}user:{user.id}"
@@ -0,0 +1,70 @@
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Bounded in-memory cache whose entries expire after a given duration.
+
+    When the cache is full, the least recently used entry is evicted.
+
+    :param maxsize: Maximum number of entries kept in the cache.
+    :param ttl: Default lifetime of an entry in seconds.
+    """
+
+    maxsize: int
+    ttl: float
+    _data: "OrderedDict[K, Tuple[float, V]]"
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: K) -> Optional[V]:
+        """Return the value stored for a key, or `None` if missing or expired."""
+        try:
+            expires_at, value = self._data[key]
+        except KeyError:
+            return None
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        """
+        Store a value for a key.
+
+        :param ttl: Lifetime of the entry in seconds.
+        Defaults to the cache lifetime. Non-positive values skip the cache.
+        """
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: K) -> Optional[V]:
+        """Remove a key from the cache and return its value, if any."""
+        entry = self._data.pop(key, None)
+        return entry[1] if entry is not None else None
+
+    def remove_value(self, value: V) -> None:
+        """Remove every entry storing a given value."""
+        for key in [key for key, entry in self._data.items() if entry[1] == value]:
+            del self._data[key]
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        self._data.clear()
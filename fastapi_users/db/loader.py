@@ -0,0 +1,107 @@
+import asyncio
+from functools import partial
+from typing import Any, Dict, Optional
+
+from fastapi.security import OAuth2PasswordRequestForm
+from pydantic import UUID4
+
+from fastapi_users.cache import TTLCache
+from fastapi_users.db.base import BaseUserDatabase
+from fastapi_users.models import UD
+
+
+class UserLoader(BaseUserDatabase[UD]):
+    """
+    Database adapter wrapper coalescing concurrent retrievals of a same user by id.
+
+    While a user is being fetched from the database, other retrievals
+    of this user wait for the pending query instead of issuing a new one.
+    Retrieved users are then kept in memory for a short duration.
+    Updates and deletions made through the loader forget the user.
+    Other attributes are read from the wrapped adapter.
+
+    The loader is meant to be owned by the `Authenticator`
+    and used within a single event loop.
+
+    :param user_db: Database adapter instance.
+    :param cache_seconds: Duration during which a retrieved user is kept in memory.
+    Set to `0` to disable the cache.
+    :param cache_size: Maximum number of users kept in memory.
+    """
+
+    user_db: BaseUserDatabase[UD]
+    _pending: Dict[UUID4, "asyncio.Future[Optional[UD]]"]
+    _cache: TTLCache[UUID4, UD]
+
+    def __init__(
+        self,
+        user_db: BaseUserDatabase[UD],
+        cache_seconds: int = 5,
+        cache_size: int = 4096,
+    ):
+        super().__init__(user_db.user_db_model)
+        self.user_db = user_db
+        self._pending = {}
+        self._cache = TTLCache(cache_size, cache_seconds)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes the loader doesn't define,
+        # e.g. the collection or the table of the wrapped adapter
+        if name == "user_db":
+            # Not set yet, e.g. while copying: don't recurse
+            raise AttributeError(name)
+        return getattr(self.user_db, name)
+
+    async def get(self, id: UUID4) -> Optional[UD]:
+        user = self._cache.get(id)
+        if user is None:
+            future = self._pending.get(id)
+            if future is None:
+                future = asyncio.ensure_future(self.user_db.get(id))
+                self._pending[id] = future
+                future.add_done_callback(partial(self._on_loaded, id))
+            # Cancelling a request shouldn't cancel the query of the other ones
+            user = await asyncio.shield(future)
+            if user is None:
+                return None
+        # Callers may modify the user: don't share the same instance
+        return user.copy(deep=True)
+
+    async def get_by_email(self, email: str) -> Optional[UD]:
+        return await self.user_db.get_by_email(email)
+
+    async def get_by_oauth_account(self, oauth: str, account_id: str) -> Optional[UD]:
+        return await self.user_db.get_by_oauth_account(oauth, account_id)
+
+    async def create(self, user: UD) -> UD:
+        return await self.user_db.create(user)
+
+    async def update(self, user: UD) -> UD:
+        updated_user = await self.user_db.update(user)
+        self.invalidate(user.id)
+        return updated_user
+
+    async def delete(self, user: UD) -> None:
+        await self.user_db.delete(user)
+        self.invalidate(user.id)
+
+    async def authenticate(
+        self, credentials: OAuth2PasswordRequestForm
+    ) -> Optional[UD]:
+        return await self.user_db.authenticate(credentials)
+
+    def invalidate(self, id: UUID4) -> None:
+        """Forget a user, so it's fetched again from the database on next get."""
+        self._cache.pop(id)
+        self._pending.pop(id, None)
+
+    def _on_loaded(self, id: UUID4, future: "asyncio.Future[Optional[UD]]") -> None:
+        # The user may have been invalidated while it was being fetched
+        if self._pending.get(id) is not future:
+            return
+        del self._pending[id]
+        if not future.cancelled() and future.exception() is None:
+            user = future.result()
+            if user is not None:
+                # The adapter may hand out instances it modifies later
+                self._cache.set(id, user.copy(deep=True))
@@ -43,6 +43,8 @@ class FastAPIUsers:
     :param user_db_model: Pydantic model of a DB representation of a user.
     :param validate_password: Optional function to validate the password
     at user registration, user update or password reset.
+    :param user_cache_seconds: Duration in seconds during which an authenticated user
+    is kept in memory. The cache is local to the process. Defaults to `0` (disabled).
 
     :attribute create_user: Helper function to create a user programmatically.
     :attribute current_user: Dependency callable getter to inject authenticated user
@@ -69,9 +71,12 @@ class FastAPIUsers:
         user_update_model: Type[models.BaseUserUpdate],
         user_db_model: Type[models.BaseUserDB],
         validate_password: Optional[ValidatePasswordProtocol] = None,
+        user_cache_seconds: int = 0,
     ):
         self.db = db
-        self.authenticator = Authenticator(auth_backends, db)
+        self.authenticator = Authenticator(
+            auth_backends, db, user_cache_seconds=user_cache_seconds
+        )
 
         self._user_model = user_model
         self._user_db_model = user_db_model
@@ -80,7 +85,7 @@ class FastAPIUsers:
         self._user_db_model = user_db_model
 
         self.create_user = get_create_user(db, user_db_model)
-        self.verify_user = get_verify_user(db)
+        self.verify_user = get_verify_user(db, self.authenticator.user_loader)
         self.get_user = get_get_user(db)
 
         self.validate_password = validate_password
@@ -160,6 +165,7 @@ class FastAPIUsers:
             after_forgot_password,
             after_reset_password,
             self.validate_password,
+            self.authenticator.user_loader,
         )
 
     def get_auth_router(
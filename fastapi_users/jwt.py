@@ -2,13 +2,82 @@ from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Union
 
 import jwt
+from jwt import DecodeError, api_jws
 from pydantic import SecretStr
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
 SecretType = Union[str, SecretStr]
 JWT_ALGORITHM = "HS256"
 
 
-def _get_secret_value(secret: SecretType) -> str:
+class JWTDecoder(jwt.PyJWT):
+    """
+    JWT decoder parsing the claims with `orjson`, if installed.
+
+    It follows the implementation of `PyJWT.decode_complete` from PyJWT 2.1.0,
+    only swapping the JSON parser. It must be reviewed when upgrading PyJWT.
+    """
+
+    def decode_complete(
+        self,
+        jwt: str,
+        key: str = "",
+        algorithms: Optional[List[str]] = None,
+        options: Optional[Dict] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        if orjson is None:  # pragma: no cover
+            return super().decode_complete(jwt, key, algorithms, options, **kwargs)
+
+        if options is None:
+            options = {"verify_signature": True}
+        else:
+            options.setdefault("verify_signature", True)
+
+        if not options["verify_signature"]:
+            options.setdefault("verify_exp", False)
+            options.setdefault("verify_nbf", False)
+            options.setdefault("verify_iat", False)
+            options.setdefault("verify_aud", False)
+            options.setdefault("verify_iss", False)
+
+        if options["verify_signature"] and not algorithms:
+            raise DecodeError(
+                'It is required that you pass in a value for the "algorithms" '
+                "argument when calling decode()."
+            )
+
+        decoded = api_jws.decode_complete(
+            jwt,
+            key=key,
+            algorithms=algorithms,  # type: ignore
+            options=options,
+            **kwargs,
+        )
+
+        try:
+            payload = orjson.loads(decoded["payload"])
+        except ValueError as e:
+            raise DecodeError(f"Invalid payload string: {e}")
+        if not isinstance(payload, dict):
+            raise DecodeError("Invalid payload string: must be a json object")
+
+        merged_options = {**self.options, **options}
+        self._validate_claims(payload, merged_options, **kwargs)
+
+        decoded["payload"] = payload
+        return decoded
+
+
+_jwt_decoder = JWTDecoder()
+
+
+def get_secret_value(secret: SecretType) -> str:
+    """Return the raw value of a secret, unwrapping it if it's a `SecretStr`."""
     if isinstance(secret, SecretStr):
         return secret.get_secret_value()
     return secret
@@ -24,7 +93,7 @@ def generate_jwt(
     if lifetime_seconds:
         expire = datetime.utcnow() + timedelta(seconds=lifetime_seconds)
         payload["exp"] = expire
-    return jwt.encode(payload, _get_secret_value(secret), algorithm=algorithm)
+    return jwt.encode(payload, get_secret_value(secret), algorithm=algorithm)
 
 
 def decode_jwt(
@@ -33,9 +102,9 @@ def decode_jwt(
     audience: List[str],
     algorithms: List[str] = [JWT_ALGORITHM],
 ) -> Dict[str, Any]:
-    return jwt.decode(
+    return _jwt_decoder.decode(
         encoded_jwt,
-        _get_secret_value(secret),
+        get_secret_value(secret),
         audience=audience,
         algorithms=algorithms,
     )
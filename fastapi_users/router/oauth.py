@@ -111,6 +111,7 @@ def get_oauth_router(
                 # Link account
                 user.oauth_accounts.append(new_oauth_account)  # type: ignore
                 await user_db.update(user)
+                authenticator.user_loader.invalidate(user.id)
             else:
                 # Create account
                 password = generate_password()
@@ -132,6 +133,7 @@ def get_oauth_router(
                     updated_oauth_accounts.append(oauth_account)
             user.oauth_accounts = updated_oauth_accounts  # type: ignore
             await user_db.update(user)
+            authenticator.user_loader.invalidate(user.id)
 
         if not user.is_active:
             raise HTTPException(
@@ -6,6 +6,7 @@ from pydantic import UUID4, EmailStr
 
 from fastapi_users import models
 from fastapi_users.db import BaseUserDatabase
+from fastapi_users.db.loader import UserLoader
 from fastapi_users.jwt import SecretType, decode_jwt, generate_jwt
 from fastapi_users.password import get_password_hash
 from fastapi_users.router.common import ErrorCode, run_handler
@@ -21,6 +22,7 @@ def get_reset_password_router(
     after_forgot_password: Optional[Callable[[models.UD, str, Request], None]] = None,
     after_reset_password: Optional[Callable[[models.UD, Request], None]] = None,
     validate_password: Optional[ValidatePasswordProtocol] = None,
+    user_loader: Optional[UserLoader] = None,
 ) -> APIRouter:
     """Generate a router with the reset password routes."""
     router = APIRouter()
@@ -87,6 +89,8 @@ def get_reset_password_router(
 
             user.hashed_password = get_password_hash(password)
             await user_db.update(user)
+            if user_loader is not None:
+                user_loader.invalidate(user.id)
             if after_reset_password:
                 await run_handler(after_reset_password, user, request)
         except jwt.PyJWTError:
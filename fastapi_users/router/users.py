@@ -64,6 +64,7 @@ def get_users_router(
             else:
                 setattr(user, field, update_dict[field])
         updated_user = await user_db.update(user)
+        authenticator.user_loader.invalidate(user.id)
         if after_update:
             await run_handler(after_update, updated_user, update_dict, request)
         return updated_user
@@ -144,6 +145,7 @@ def get_users_router(
     async def delete_user(id: UUID4):
         user = await _get_or_404(id)
         await user_db.delete(user)
+        authenticator.user_loader.invalidate(user.id)
         return None
 
     return router
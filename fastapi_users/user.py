@@ -1,4 +1,4 @@
-from typing import Any, Awaitable, Type, Union
+from typing import Any, Awaitable, Optional, Type, Union
 
 try:
     from typing import Protocol
@@ -9,6 +9,7 @@ from pydantic import EmailStr
 
 from fastapi_users import models
 from fastapi_users.db import BaseUserDatabase
+from fastapi_users.db.loader import UserLoader
 from fastapi_users.password import get_password_hash
 
 
@@ -83,13 +84,18 @@ class VerifyUserProtocol(Protocol):  # pragma: no cover
 
 def get_verify_user(
     user_db: BaseUserDatabase[models.BaseUserDB],
+    user_loader: Optional[UserLoader] = None,
 ) -> VerifyUserProtocol:
+
     async def verify_user(user: models.BaseUserDB) -> models.BaseUserDB:
         if user.is_verified:
             raise UserAlreadyVerified()
 
         user.is_verified = True
-        return await user_db.update(user)
+        updated_user = await user_db.update(user)
+        if user_loader is not None:
+            user_loader.invalidate(user.id)
+        return updated_user
 
     return verify_user
 
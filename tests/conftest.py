@@ -1,4 +1,5 @@
 import asyncio
+import re
 from typing import AsyncGenerator, List, Optional
 
 import asynctest
@@ -13,7 +14,9 @@ from starlette.applications import ASGIApp
 
 from fastapi_users import models
 from fastapi_users.authentication import Authenticator, BaseAuthentication
+from fastapi_users.authentication.cookie import BaseCookieAuthentication
 from fastapi_users.db import BaseUserDatabase
+from fastapi_users.db.loader import UserLoader
 from fastapi_users.jwt import SecretType
 from fastapi_users.models import BaseOAuthAccount, BaseOAuthAccountMixin, BaseUserDB
 from fastapi_users.password import get_password_hash
@@ -257,6 +260,11 @@ def mock_user_db(
     return MockUserDatabase(UserDB)
 
 
+@pytest.fixture
+def user_loader(mock_user_db) -> UserLoader:
+    return UserLoader(mock_user_db)
+
+
 @pytest.fixture
 def mock_user_db_oauth(
     user_oauth,
@@ -349,6 +357,67 @@ def mock_authentication():
     return MockAuthentication()
 
 
+@pytest.fixture(
+    params=[
+        ("/", None, True, True),
+        ("/arthur", None, True, True),
+        ("/", "camelot.bt", True, True),
+        ("/", None, False, True),
+        ("/", None, True, False),
+    ]
+)
+def cookie_params(request):
+    path, domain, secure, httponly = request.param
+    return {
+        "cookie_path": path,
+        "cookie_domain": domain,
+        "cookie_secure": secure,
+        "cookie_httponly": httponly,
+    }
+
+
+def get_set_cookie(response: Response) -> str:
+    cookies = [header for header in response.raw_headers if header[0] == b"set-cookie"]
+    assert len(cookies) == 1
+    return cookies[0][1].decode("latin-1")
+
+
+def assert_login_cookie(
+    response: Response, cookie_authentication: BaseCookieAuthentication
+) -> str:
+    """Check the login cookie against the backend parameters and return its value."""
+    cookie = get_set_cookie(response)
+
+    assert f"Max-Age={cookie_authentication.lifetime_seconds}" in cookie
+    assert f"Path={cookie_authentication.cookie_path}" in cookie
+    assert f"SameSite={cookie_authentication.cookie_samesite}" in cookie
+
+    domain = cookie_authentication.cookie_domain
+    if domain:
+        assert f"Domain={domain}" in cookie
+    else:
+        assert "Domain=" not in cookie
+
+    if cookie_authentication.cookie_secure:
+        assert "Secure" in cookie
+    else:
+        assert "Secure" not in cookie
+
+    if cookie_authentication.cookie_httponly:
+        assert "HttpOnly" in cookie
+    else:
+        assert "HttpOnly" not in cookie
+
+    cookie_name_value = re.match(r"^(\w+)=([^;]+);", cookie)
+    assert cookie_name_value is not None
+    assert cookie_name_value[1] == cookie_authentication.cookie_name
+    return cookie_name_value[2]
+
+
+def assert_logout_cookie(response: Response) -> None:
+    assert "Max-Age=0" in get_set_cookie(response)
+
+
 @pytest.fixture
 def get_test_client():
     async def _get_test_client(app: ASGIApp) -> AsyncGenerator[httpx.AsyncClient, None]:
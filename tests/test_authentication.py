@@ -1,10 +1,16 @@
+import inspect
 from typing import Optional
 
 import pytest
 from fastapi import Request, status
 from fastapi.security.base import SecurityBase
 
-from fastapi_users.authentication import BaseAuthentication, DuplicateBackendNamesError
+from fastapi_users.authentication import (
+    Authenticator,
+    BaseAuthentication,
+    DuplicateBackendNamesError,
+    name_to_variable_name,
+)
 from fastapi_users.db import BaseUserDatabase
 from fastapi_users.models import BaseUserDB
 
@@ -37,6 +43,23 @@ class BackendUser(BaseAuthentication[str]):
         return self.user
 
 
+@pytest.mark.authentication
+@pytest.mark.parametrize(
+    "name,expected",
+    [
+        ("jwt", "jwt"),
+        ("my-cookie", "mycookie"),
+        ("my_cookie 2", "my_cookie2"),
+        ("42-jwt", "jwt"),
+        ("_42jwt", "_42jwt"),
+        ("é-jwt", "jwt"),
+        ("123", ""),
+    ],
+)
+def test_name_to_variable_name(name: str, expected: str):
+    assert name_to_variable_name(name) == expected
+
+
 @pytest.mark.authentication
 @pytest.mark.asyncio
 async def test_authenticator(get_test_auth_client, user):
@@ -61,3 +84,33 @@ async def test_authenticators_with_same_name(get_test_auth_client):
     with pytest.raises(DuplicateBackendNamesError):
         async for client in get_test_auth_client([BackendNone(), BackendNone()]):
             pass
+
+
+@pytest.mark.authentication
+def test_authenticator_current_user_cached(mock_user_db):
+    authenticator = Authenticator([BackendNone()], mock_user_db)
+    current_user = authenticator.current_user(active=True)
+    assert authenticator.current_user(active=True) is current_user
+    assert authenticator.current_user(active=True, superuser=True) is not current_user
+
+
+@pytest.mark.authentication
+def test_authenticator_dependencies_shared(mock_user_db):
+    authenticator = Authenticator(
+        [BackendNone(), BackendNone(name="none-bis")], mock_user_db
+    )
+    current_user = authenticator.current_user()
+    current_superuser = authenticator.current_user(superuser=True)
+
+    parameters = inspect.signature(current_user).parameters.values()
+    superuser_parameters = inspect.signature(current_superuser).parameters.values()
+    for parameter, superuser_parameter in zip(parameters, superuser_parameters):
+        assert parameter.default is superuser_parameter.default
+
+
+@pytest.mark.authentication
+def test_authenticator_init_with_same_variable_name(mock_user_db):
+    with pytest.raises(DuplicateBackendNamesError):
+        Authenticator(
+            [BackendNone(name="my-none"), BackendNone(name="mynone")], mock_user_db
+        )
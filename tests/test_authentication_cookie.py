@@ -1,34 +1,21 @@
-import re
-
 import pytest
 from fastapi import Response
 
-from fastapi_users.authentication.cookie import CookieAuthentication
+from fastapi_users.authentication.cookie import (
+    BaseCookieAuthentication,
+    CookieAuthentication,
+)
 from fastapi_users.jwt import SecretType, decode_jwt, generate_jwt
+from tests.conftest import assert_login_cookie, assert_logout_cookie
 
 LIFETIME = 3600
 COOKIE_NAME = "COOKIE_NAME"
 
 
-@pytest.fixture(
-    params=[
-        ("/", None, True, True),
-        ("/arthur", None, True, True),
-        ("/", "camelot.bt", True, True),
-        ("/", None, False, True),
-        ("/", None, True, False),
-    ]
-)
-def cookie_authentication(secret: SecretType, request):
-    path, domain, secure, httponly = request.param
+@pytest.fixture
+def cookie_authentication(secret: SecretType, cookie_params):
     return CookieAuthentication(
-        secret,
-        lifetime_seconds=LIFETIME,
-        cookie_name=COOKIE_NAME,
-        cookie_path=path,
-        cookie_domain=domain,
-        cookie_secure=secure,
-        cookie_httponly=httponly,
+        secret, lifetime_seconds=LIFETIME, cookie_name=COOKIE_NAME, **cookie_params
     )
 
 
@@ -48,6 +35,26 @@ def test_default_name(cookie_authentication: CookieAuthentication):
     assert cookie_authentication.name == "cookie"
 
 
+@pytest.mark.authentication
+@pytest.mark.parametrize(
+    "attribute",
+    [
+        "secret",
+        "cookie_name",
+        "cookie_path",
+        "cookie_domain",
+        "cookie_secure",
+        "cookie_httponly",
+        "cookie_samesite",
+    ],
+)
+def test_read_only_attributes(
+    cookie_authentication: CookieAuthentication, attribute: str
+):
+    with pytest.raises(AttributeError):
+        setattr(cookie_authentication, attribute, "NEW_VALUE")
+
+
 @pytest.mark.authentication
 class TestAuthenticate:
     @pytest.mark.asyncio
@@ -86,16 +93,66 @@ class TestAuthenticate:
         assert authenticated_user is not None
         assert authenticated_user.id == user.id
 
+    @pytest.mark.asyncio
+    async def test_valid_token_get_value_error(
+        self,
+        mocker,
+        mock_user_db,
+        token,
+        user,
+        cookie_authentication: CookieAuthentication,
+    ):
+        mocker.patch.object(mock_user_db, "get", side_effect=ValueError())
+        authenticated_user = await cookie_authentication(token(user.id), mock_user_db)
+        assert authenticated_user is None
+
+    @pytest.mark.asyncio
+    async def test_valid_token_cached(
+        self,
+        mocker,
+        mock_user_db,
+        token,
+        user,
+        cookie_authentication: CookieAuthentication,
+    ):
+        decode_jwt_spy = mocker.spy(cookie_authentication._jwt, "decode")
+        user_token = token(user.id)
+        for _ in range(2):
+            authenticated_user = await cookie_authentication(user_token, mock_user_db)
+            assert authenticated_user is not None
+            assert authenticated_user.id == user.id
+        assert decode_jwt_spy.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_valid_token_cache_disabled(
+        self, mocker, mock_user_db, token, user, secret
+    ):
+        cookie_authentication = CookieAuthentication(
+            secret, lifetime_seconds=LIFETIME, token_cache_seconds=0
+        )
+        decode_jwt_spy = mocker.spy(cookie_authentication._jwt, "decode")
+        user_token = token(user.id)
+        for _ in range(2):
+            authenticated_user = await cookie_authentication(user_token, mock_user_db)
+            assert authenticated_user is not None
+        assert decode_jwt_spy.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_valid_token_without_expiration_cached(
+        self, mocker, mock_user_db, token, user, secret
+    ):
+        cookie_authentication = CookieAuthentication(secret)
+        decode_jwt_spy = mocker.spy(cookie_authentication._jwt, "decode")
+        user_token = token(user.id, lifetime=None)
+        for _ in range(2):
+            authenticated_user = await cookie_authentication(user_token, mock_user_db)
+            assert authenticated_user is not None
+        assert decode_jwt_spy.call_count == 1
+
 
 @pytest.mark.authentication
 @pytest.mark.asyncio
 async def test_get_login_response(user, cookie_authentication: CookieAuthentication):
-    secret = cookie_authentication.secret
-    path = cookie_authentication.cookie_path
-    domain = cookie_authentication.cookie_domain
-    secure = cookie_authentication.cookie_secure
-    httponly = cookie_authentication.cookie_httponly
-
     response = Response()
     login_response = await cookie_authentication.get_login_response(user, response)
 
@@ -103,37 +160,10 @@ async def test_get_login_response(user, cookie_authentication: CookieAuthenticat
     # so that FastAPI can terminate it properly
     assert login_response is None
 
-    cookies = [header for header in response.raw_headers if header[0] == b"set-cookie"]
-    assert len(cookies) == 1
-
-    cookie = cookies[0][1].decode("latin-1")
-
-    assert f"Max-Age={LIFETIME}" in cookie
-    assert f"Path={path}" in cookie
-
-    if domain:
-        assert f"Domain={domain}" in cookie
-    else:
-        assert "Domain=" not in cookie
-
-    if secure:
-        assert "Secure" in cookie
-    else:
-        assert "Secure" not in cookie
-
-    if httponly:
-        assert "HttpOnly" in cookie
-    else:
-        assert "HttpOnly" not in cookie
-
-    cookie_name_value = re.match(r"^(\w+)=([^;]+);", cookie)
-    assert cookie_name_value is not None
-
-    cookie_name = cookie_name_value[1]
-    assert cookie_name == COOKIE_NAME
-
-    cookie_value = cookie_name_value[2]
-    decoded = decode_jwt(cookie_value, secret, audience=["fastapi-users:auth"])
+    cookie_value = assert_login_cookie(response, cookie_authentication)
+    decoded = decode_jwt(
+        cookie_value, cookie_authentication.secret, audience=["fastapi-users:auth"]
+    )
     assert decoded["user_id"] == str(user.id)
 
 
@@ -147,9 +177,25 @@ async def test_get_logout_response(user, cookie_authentication: CookieAuthentica
     # so that FastAPI can terminate it properly
     assert logout_response is None
 
-    cookies = [header for header in response.raw_headers if header[0] == b"set-cookie"]
-    assert len(cookies) == 1
+    assert_logout_cookie(response)
 
-    cookie = cookies[0][1].decode("latin-1")
 
-    assert "Max-Age=0" in cookie
+@pytest.mark.authentication
+@pytest.mark.asyncio
+async def test_get_logout_response_clears_token_cache(
+    mocker, mock_user_db, token, user, cookie_authentication: CookieAuthentication
+):
+    decode_jwt_spy = mocker.spy(cookie_authentication._jwt, "decode")
+    user_token = token(user.id)
+    await cookie_authentication(user_token, mock_user_db)
+    await cookie_authentication.get_logout_response(user, Response())
+    await cookie_authentication(user_token, mock_user_db)
+    assert decode_jwt_spy.call_count == 2
+
+
+@pytest.mark.authentication
+@pytest.mark.asyncio
+async def test_base_generate_token_not_implemented(user):
+    base_cookie_authentication = BaseCookieAuthentication("base", LIFETIME, COOKIE_NAME)
+    with pytest.raises(NotImplementedError):
+        await base_cookie_authentication.get_login_response(user, Response())
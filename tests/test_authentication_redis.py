@@ -0,0 +1,263 @@
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+from fastapi import Response
+
+from fastapi_users.authentication import RedisSessionAuthentication
+from tests.conftest import assert_login_cookie, assert_logout_cookie
+
+LIFETIME = 3600
+COOKIE_NAME = "COOKIE_NAME"
+
+
+class MockRedis:
+    def __init__(self):
+        self.store: Dict[str, bytes] = {}
+        self.sorted_sets: Dict[str, Dict[bytes, float]] = {}
+        self.expirations: Dict[str, int] = {}
+
+    def pipeline(self, transaction: bool = True) -> "MockPipeline":
+        assert transaction is True
+        return MockPipeline(self)
+
+    async def get(self, name: str) -> Optional[bytes]:
+        if name in self.sorted_sets:
+            raise RuntimeError(
+                "WRONGTYPE Operation against a key holding the wrong kind of value"
+            )
+        return self.store.get(name)
+
+    async def setex(self, name: str, time: int, value: str) -> None:
+        self.store[name] = value.encode()
+        self.expirations[name] = time
+
+    async def zadd(self, name: str, mapping: Dict[str, float]) -> None:
+        self.sorted_sets.setdefault(name, {}).update(
+            (member.encode(), score) for member, score in mapping.items()
+        )
+
+    async def zremrangebyscore(self, name: str, min: Any, max: float) -> None:
+        sorted_set = self.sorted_sets.get(name, {})
+        for member in [member for member, score in sorted_set.items() if score <= max]:
+            del sorted_set[member]
+
+    async def zrange(self, name: str, start: int, end: int) -> List[bytes]:
+        sorted_set = self.sorted_sets.get(name, {})
+        return sorted(sorted_set, key=sorted_set.__getitem__)
+
+    async def expire(self, name: str, time: int) -> None:
+        self.expirations[name] = time
+
+    async def delete(self, *names: str) -> None:
+        for name in names:
+            self.store.pop(name, None)
+            self.sorted_sets.pop(name, None)
+
+
+class MockPipeline:
+    """Buffer the commands and run them all at once on `execute`, like MULTI."""
+
+    def __init__(self, redis: MockRedis):
+        self.redis = redis
+        self.commands: List[Tuple[str, tuple]] = []
+
+    async def __aenter__(self) -> "MockPipeline":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        self.commands = []
+
+    def __getattr__(self, name: str):
+        def _command(*args) -> "MockPipeline":
+            self.commands.append((name, args))
+            return self
+
+        return _command
+
+    async def execute(self) -> None:
+        for name, args in self.commands:
+            await getattr(self.redis, name)(*args)
+        self.commands = []
+
+
+@pytest.fixture
+def redis() -> MockRedis:
+    return MockRedis()
+
+
+@pytest.fixture
+def redis_authentication(redis: MockRedis, cookie_params):
+    return RedisSessionAuthentication(
+        redis, lifetime_seconds=LIFETIME, cookie_name=COOKIE_NAME, **cookie_params
+    )
+
+
+@pytest.fixture
+def session(redis: MockRedis):
+    def _session(user_id, session_id="SESSION_ID"):
+        redis.store[f"fastapi_users:session:{session_id}"] = str(user_id).encode()
+        return session_id
+
+    return _session
+
+
+@pytest.mark.authentication
+def test_default_name(redis_authentication: RedisSessionAuthentication):
+    assert redis_authentication.name == "redis"
+
+
+@pytest.mark.authentication
+class TestAuthenticate:
+    @pytest.mark.asyncio
+    async def test_missing_token(
+        self, mock_user_db, redis_authentication: RedisSessionAuthentication
+    ):
+        authenticated_user = await redis_authentication(None, mock_user_db)
+        assert authenticated_user is None
+
+    @pytest.mark.asyncio
+    async def test_unknown_session(
+        self, mock_user_db, redis_authentication: RedisSessionAuthentication
+    ):
+        authenticated_user = await redis_authentication("foo", mock_user_db)
+        assert authenticated_user is None
+
+    @pytest.mark.asyncio
+    async def test_user_key(
+        self, mock_user_db, user, redis_authentication: RedisSessionAuthentication
+    ):
+        await redis_authentication._generate_token(user)
+        authenticated_user = await redis_authentication(f"user:{user.id}", mock_user_db)
+        assert authenticated_user is None
+
+    @pytest.mark.asyncio
+    async def test_invalid_uuid(
+        self, mock_user_db, session, redis_authentication: RedisSessionAuthentication
+    ):
+        authenticated_user = await redis_authentication(session("foo"), mock_user_db)
+        assert authenticated_user is None
+
+    @pytest.mark.asyncio
+    async def test_unknown_user(
+        self, mock_user_db, session, redis_authentication: RedisSessionAuthentication
+    ):
+        authenticated_user = await redis_authentication(
+            session(uuid.uuid4()), mock_user_db
+        )
+        assert authenticated_user is None
+
+    @pytest.mark.asyncio
+    async def test_valid_session(
+        self,
+        mock_user_db,
+        session,
+        user,
+        redis_authentication: RedisSessionAuthentication,
+    ):
+        authenticated_user = await redis_authentication(session(user.id), mock_user_db)
+        assert authenticated_user is not None
+        assert authenticated_user.id == user.id
+
+    @pytest.mark.asyncio
+    async def test_valid_session_get_value_error(
+        self,
+        mocker,
+        mock_user_db,
+        session,
+        user,
+        redis_authentication: RedisSessionAuthentication,
+    ):
+        mocker.patch.object(mock_user_db, "get", side_effect=ValueError())
+        authenticated_user = await redis_authentication(session(user.id), mock_user_db)
+        assert authenticated_user is None
+
+    @pytest.mark.asyncio
+    async def test_valid_session_str_response(
+        self, mock_user_db, user, redis: MockRedis
+    ):
+        redis.store["fastapi_users:session:SESSION_ID"] = str(user.id)  # type: ignore
+        redis_authentication = RedisSessionAuthentication(redis, LIFETIME)
+        authenticated_user = await redis_authentication("SESSION_ID", mock_user_db)
+        assert authenticated_user is not None
+        assert authenticated_user.id == user.id
+
+
+@pytest.mark.authentication
+@pytest.mark.asyncio
+async def test_get_login_response(
+    user, redis: MockRedis, redis_authentication: RedisSessionAuthentication
+):
+    response = Response()
+    login_response = await redis_authentication.get_login_response(user, response)
+
+    # We shouldn't return directly the response
+    # so that FastAPI can terminate it properly
+    assert login_response is None
+
+    session_id = assert_login_cookie(response, redis_authentication)
+    session_key = f"fastapi_users:session:{session_id}"
+    assert redis.store[session_key] == str(user.id).encode()
+    assert redis.expirations[session_key] == LIFETIME
+
+    user_key = f"fastapi_users:user:{user.id}"
+    assert set(redis.sorted_sets[user_key]) == {session_id.encode()}
+    assert redis.expirations[user_key] == LIFETIME
+
+
+@pytest.mark.authentication
+@pytest.mark.asyncio
+async def test_get_logout_response(
+    user,
+    mock_user_db,
+    redis: MockRedis,
+    redis_authentication: RedisSessionAuthentication,
+):
+    session_ids = []
+    for _ in range(2):
+        session_ids.append(await redis_authentication._generate_token(user))
+
+    response = Response()
+    logout_response = await redis_authentication.get_logout_response(user, response)
+
+    # We shouldn't return directly the response
+    # so that FastAPI can terminate it properly
+    assert logout_response is None
+
+    assert_logout_cookie(response)
+
+    assert redis.store == {}
+    assert redis.sorted_sets == {}
+    for session_id in session_ids:
+        assert await redis_authentication(session_id, mock_user_db) is None
+
+
+@pytest.mark.authentication
+@pytest.mark.asyncio
+async def test_login_forgets_expired_sessions(
+    mocker, user, redis: MockRedis, redis_authentication: RedisSessionAuthentication
+):
+    time = mocker.patch("fastapi_users.authentication.redis.time")
+    time.time.return_value = 1000.0
+    expired_session_id = await redis_authentication._generate_token(user)
+    # Redis expires the session key on its own
+    del redis.store[f"fastapi_users:session:{expired_session_id}"]
+
+    time.time.return_value = 1000.0 + LIFETIME
+    session_id = await redis_authentication._generate_token(user)
+
+    user_key = f"fastapi_users:user:{user.id}"
+    assert redis.sorted_sets[user_key] == {session_id.encode(): 1000.0 + 2 * LIFETIME}
+
+
+@pytest.mark.authentication
+@pytest.mark.asyncio
+async def test_login_single_transaction(
+    mocker, user, redis: MockRedis, redis_authentication: RedisSessionAuthentication
+):
+    mocker.patch.object(MockPipeline, "execute", side_effect=ConnectionError())
+    with pytest.raises(ConnectionError):
+        await redis_authentication._generate_token(user)
+
+    assert redis.store == {}
+    assert redis.sorted_sets == {}
@@ -0,0 +1,82 @@
+import pytest
+
+from fastapi_users.cache import TTLCache
+
+
+@pytest.fixture
+def clock(mocker):
+    now = [1000.0]
+    mocker.patch("fastapi_users.cache.time.monotonic", side_effect=lambda: now[0])
+    return now
+
+
+@pytest.mark.authentication
+def test_get_missing():
+    cache: TTLCache[str, int] = TTLCache(2, 10)
+    assert cache.get("foo") is None
+
+
+@pytest.mark.authentication
+def test_set_get():
+    cache: TTLCache[str, int] = TTLCache(2, 10)
+    cache.set("foo", 1)
+    assert cache.get("foo") == 1
+    assert len(cache) == 1
+
+
+@pytest.mark.authentication
+def test_expiration(clock):
+    cache: TTLCache[str, int] = TTLCache(2, 10)
+    cache.set("foo", 1)
+    clock[0] += 10
+    assert cache.get("foo") is None
+    assert len(cache) == 0
+
+
+@pytest.mark.authentication
+def test_custom_ttl_capped(clock):
+    cache: TTLCache[str, int] = TTLCache(2, 10)
+    cache.set("foo", 1, ttl=5)
+    cache.set("bar", 2, ttl=60)
+    clock[0] += 5
+    assert cache.get("foo") is None
+    assert cache.get("bar") == 2
+    clock[0] += 5
+    assert cache.get("bar") is None
+
+
+@pytest.mark.authentication
+@pytest.mark.parametrize(
+    "maxsize,ttl,entry_ttl", [(2, 0, None), (0, 10, None), (2, 10, -1)]
+)
+def test_disabled(maxsize, ttl, entry_ttl):
+    cache: TTLCache[str, int] = TTLCache(maxsize, ttl)
+    cache.set("foo", 1, ttl=entry_ttl)
+    assert cache.get("foo") is None
+
+
+@pytest.mark.authentication
+def test_lru_eviction():
+    cache: TTLCache[str, int] = TTLCache(2, 10)
+    cache.set("foo", 1)
+    cache.set("bar", 2)
+    assert cache.get("foo") == 1
+    cache.set("baz", 3)
+    assert cache.get("bar") is None
+    assert cache.get("foo") == 1
+    assert cache.get("baz") == 3
+
+
+@pytest.mark.authentication
+def test_pop_clear():
+    cache: TTLCache[str, int] = TTLCache(2, 10)
+    cache.set("foo", 1)
+    cache.set("bar", 2)
+    assert cache.pop("foo") == 1
+    assert cache.pop("foo") is None
+    cache.set("baz", 2)
+    cache.remove_value(2)
+    assert len(cache) == 0
+    cache.set("bar", 2)
+    cache.clear()
+    assert cache.get("bar") is None
@@ -0,0 +1,176 @@
+import asyncio
+import copy
+import uuid
+
+import pytest
+from fastapi.security import OAuth2PasswordRequestForm
+
+from fastapi_users.db.loader import UserLoader
+
+
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_get_coalesced(mocker, mock_user_db, user_loader, user, superuser):
+    get_spy = mocker.spy(mock_user_db, "get")
+
+    results = await asyncio.gather(
+        user_loader.get(user.id),
+        user_loader.get(user.id),
+        user_loader.get(superuser.id),
+    )
+
+    assert results == [user, user, superuser]
+    assert get_spy.call_count == 2
+
+
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_get_missing_not_cached(mocker, mock_user_db, user_loader):
+    get_spy = mocker.spy(mock_user_db, "get")
+
+    id = uuid.uuid4()
+    assert await user_loader.get(id) is None
+    assert await user_loader.get(id) is None
+    assert get_spy.call_count == 2
+
+
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_get_error(mocker, mock_user_db, user_loader, user):
+    mocker.patch.object(mock_user_db, "get", side_effect=RuntimeError())
+
+    results = await asyncio.gather(
+        user_loader.get(user.id), user_loader.get(user.id), return_exceptions=True
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_get_cached(mocker, mock_user_db, user_loader, user):
+    get_spy = mocker.spy(mock_user_db, "get")
+
+    loaded_user = await user_loader.get(user.id)
+    loaded_user.is_active = False
+    cached_user = await user_loader.get(user.id)
+
+    assert cached_user == user
+    assert cached_user is not loaded_user
+    assert get_spy.call_count == 1
+
+
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_get_cache_disabled(mocker, mock_user_db, user):
+    get_spy = mocker.spy(mock_user_db, "get")
+    user_loader = UserLoader(mock_user_db, cache_seconds=0)
+
+    assert await user_loader.get(user.id) == user
+    assert await user_loader.get(user.id) == user
+    assert get_spy.call_count == 2
+
+
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_invalidate(mocker, mock_user_db, user_loader, user):
+    get_spy = mocker.spy(mock_user_db, "get")
+
+    await user_loader.get(user.id)
+    user_loader.invalidate(user.id)
+    await user_loader.get(user.id)
+
+    assert get_spy.call_count == 2
+
+
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_invalidate_while_pending(mocker, mock_user_db, user_loader, user):
+    get_spy = mocker.spy(mock_user_db, "get")
+
+    pending = asyncio.ensure_future(user_loader.get(user.id))
+    await asyncio.sleep(0)
+    user_loader.invalidate(user.id)
+    assert await pending == user
+    await user_loader.get(user.id)
+
+    assert get_spy.call_count == 2
+
+
+@pytest.mark.db
+@pytest.mark.asyncio
+@pytest.mark.parametrize("method", ["update", "delete"])
+async def test_write_invalidates(mocker, mock_user_db, user_loader, user, method):
+    get_spy = mocker.spy(mock_user_db, "get")
+    write_spy = mocker.spy(mock_user_db, method)
+
+    await user_loader.get(user.id)
+    await getattr(user_loader, method)(user)
+    await user_loader.get(user.id)
+
+    write_spy.assert_called_once_with(user)
+    assert get_spy.call_count == 2
+
+
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_delegates(mocker, mock_user_db, user_loader, user):
+    get_by_email_spy = mocker.spy(mock_user_db, "get_by_email")
+    create_spy = mocker.spy(mock_user_db, "create")
+    authenticate_spy = mocker.spy(mock_user_db, "authenticate")
+
+    assert await user_loader.get_by_email(user.email) == user
+    assert await user_loader.create(user) == user
+    form = OAuth2PasswordRequestForm(
+        username=user.email, password="guinevere", scope=""
+    )
+    assert await user_loader.authenticate(form) == user
+
+    get_by_email_spy.assert_any_call(user.email)
+    create_spy.assert_called_once_with(user)
+    authenticate_spy.assert_called_once_with(form)
+
+
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_get_by_oauth_account(mock_user_db_oauth, user_oauth):
+    user_loader = UserLoader(mock_user_db_oauth)
+    oauth_account = user_oauth.oauth_accounts[0]
+
+    assert (
+        await user_loader.get_by_oauth_account(
+            oauth_account.oauth_name, oauth_account.account_id
+        )
+        == user_oauth
+    )
+
+
+@pytest.mark.db
+@pytest.mark.asyncio
+async def test_get_cached_lists_not_shared(
+    mock_user_db_oauth, user_oauth, oauth_account3
+):
+    user_loader = UserLoader(mock_user_db_oauth, cache_seconds=10)
+
+    loaded_user = await user_loader.get(user_oauth.id)
+    loaded_user.oauth_accounts.append(oauth_account3)
+    cached_user = await user_loader.get(user_oauth.id)
+
+    assert len(cached_user.oauth_accounts) == 2
+    assert len(user_oauth.oauth_accounts) == 2
+
+
+@pytest.mark.db
+def test_adapter_attributes(mock_user_db, user_loader):
+    mock_user_db.collection = "users"
+
+    assert user_loader.collection == "users"
+    with pytest.raises(AttributeError):
+        user_loader.unknown_attribute
+
+
+@pytest.mark.db
+def test_copy(user_loader):
+    copied_user_loader = copy.copy(user_loader)
+
+    assert copied_user_loader.user_db is user_loader.user_db
@@ -0,0 +1,61 @@
+import jwt
+import pytest
+
+from fastapi_users.jwt import JWT_ALGORITHM, JWTDecoder, decode_jwt, generate_jwt
+
+AUDIENCE = ["fastapi-users:auth"]
+
+
+@pytest.fixture
+def jwt_decoder() -> JWTDecoder:
+    return JWTDecoder()
+
+
+@pytest.mark.authentication
+def test_decode_jwt(secret):
+    token = generate_jwt({"user_id": "foo", "aud": AUDIENCE}, secret, 3600)
+    data = decode_jwt(token, secret, AUDIENCE)
+    assert data["user_id"] == "foo"
+
+
+@pytest.mark.authentication
+def test_decode_jwt_expired(secret):
+    token = generate_jwt({"user_id": "foo", "aud": AUDIENCE}, secret, -1)
+    with pytest.raises(jwt.ExpiredSignatureError):
+        decode_jwt(token, secret, AUDIENCE)
+
+
+@pytest.mark.authentication
+def test_decode_jwt_invalid_audience(secret):
+    token = generate_jwt({"user_id": "foo", "aud": ["foo"]}, secret, 3600)
+    with pytest.raises(jwt.InvalidAudienceError):
+        decode_jwt(token, secret, AUDIENCE)
+
+
+@pytest.mark.authentication
+def test_decode_missing_algorithms(jwt_decoder: JWTDecoder):
+    token = jwt.encode({"user_id": "foo"}, "SECRET", algorithm=JWT_ALGORITHM)
+    with pytest.raises(jwt.DecodeError):
+        jwt_decoder.decode(token, "SECRET")
+
+
+@pytest.mark.authentication
+def test_decode_without_signature_verification(jwt_decoder: JWTDecoder):
+    token = generate_jwt({"user_id": "foo", "aud": ["foo"]}, "SECRET", -1)
+    data = jwt_decoder.decode(token, options={"verify_signature": False})
+    assert data["user_id"] == "foo"
+
+
+@pytest.mark.authentication
+@pytest.mark.parametrize("payload", [b"foo", b"[]"])
+def test_decode_invalid_payload(jwt_decoder: JWTDecoder, payload: bytes):
+    token = jwt.api_jws.encode(payload, "SECRET", algorithm=JWT_ALGORITHM)
+    with pytest.raises(jwt.DecodeError):
+        jwt_decoder.decode(token, "SECRET", algorithms=[JWT_ALGORITHM])
+
+
+@pytest.mark.authentication
+def test_pyjwt_version():
+    # JWTDecoder.decode_complete copies this version of PyJWT,
+    # including its private _validate_claims: review it when upgrading
+    assert jwt.__version__ == "2.1.0"
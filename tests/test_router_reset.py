@@ -59,6 +59,7 @@ async def test_app_client(
     after_reset_password,
     get_test_client,
     validate_password,
+    user_loader,
 ) -> AsyncGenerator[httpx.AsyncClient, None]:
     reset_router = get_reset_password_router(
         mock_user_db,
@@ -67,6 +68,7 @@ async def test_app_client(
         after_forgot_password,
         after_reset_password,
         validate_password,
+        user_loader,
     )
 
     app = FastAPI()
@@ -261,8 +263,10 @@ class TestResetPassword:
         forgot_password_token,
         user: UserDB,
         after_reset_password,
+        user_loader,
     ):
         mocker.spy(mock_user_db, "update")
+        mocker.spy(user_loader, "invalidate")
         current_hashed_password = user.hashed_password
 
         json = {"token": forgot_password_token(user.id), "password": "holygrail"}
@@ -272,6 +276,7 @@ class TestResetPassword:
 
         updated_user = mock_user_db.update.call_args[0][0]
         assert updated_user.hashed_password != current_hashed_password
+        user_loader.invalidate.assert_called_once_with(user.id)
 
         assert after_reset_password.called is True
         actual_user = after_reset_password.call_args[0][0]
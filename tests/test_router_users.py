@@ -6,7 +6,8 @@ import httpx
 import pytest
 from fastapi import FastAPI, Request, status
 
-from fastapi_users.authentication import Authenticator
+from fastapi_users.authentication import Authenticator, CookieAuthentication
+from fastapi_users.jwt import generate_jwt
 from fastapi_users.router import ErrorCode, get_users_router
 from tests.conftest import MockAuthentication, User, UserDB, UserUpdate
 
@@ -1060,3 +1061,103 @@ class TestDeleteUser:
 
         deleted_user = mock_user_db.delete.call_args[0][0]
         assert deleted_user.id == user.id
+
+
+@pytest.fixture
+def cookie_headers(secret):
+    def _cookie_headers(user: UserDB) -> Dict[str, str]:
+        data = {"user_id": str(user.id), "aud": "fastapi-users:auth"}
+        return {"Cookie": f"fastapiusersauth={generate_jwt(data, secret, 3600)}"}
+
+    return _cookie_headers
+
+
+@pytest.fixture
+@pytest.mark.asyncio
+async def test_app_client_user_cache(
+    secret, mock_user_db, get_test_client
+) -> AsyncGenerator[httpx.AsyncClient, None]:
+    authenticator = Authenticator(
+        [CookieAuthentication(secret, 3600)], mock_user_db, user_cache_seconds=3600
+    )
+    user_router = get_users_router(
+        mock_user_db, User, UserUpdate, UserDB, authenticator
+    )
+
+    app = FastAPI()
+    app.include_router(user_router)
+
+    async for client in get_test_client(app):
+        yield client
+
+
+@pytest.mark.router
+@pytest.mark.asyncio
+class TestUserCache:
+    async def test_deactivated_user(
+        self,
+        test_app_client_user_cache: httpx.AsyncClient,
+        cookie_headers,
+        user: UserDB,
+        superuser: UserDB,
+    ):
+        client = test_app_client_user_cache
+        response = await client.get("/me", headers=cookie_headers(user))
+        assert response.status_code == status.HTTP_200_OK
+
+        response = await client.patch(
+            f"/{user.id}",
+            json={"is_active": False},
+            headers=cookie_headers(superuser),
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        response = await client.get("/me", headers=cookie_headers(user))
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    async def test_demoted_superuser(
+        self,
+        test_app_client_user_cache: httpx.AsyncClient,
+        cookie_headers,
+        user: UserDB,
+        superuser: UserDB,
+        verified_superuser: UserDB,
+    ):
+        client = test_app_client_user_cache
+        response = await client.get(f"/{user.id}", headers=cookie_headers(superuser))
+        assert response.status_code == status.HTTP_200_OK
+
+        response = await client.patch(
+            f"/{superuser.id}",
+            json={"is_superuser": False},
+            headers=cookie_headers(verified_superuser),
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        response = await client.get(f"/{user.id}", headers=cookie_headers(superuser))
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    async def test_deleted_user(
+        self,
+        monkeypatch,
+        test_app_client_user_cache: httpx.AsyncClient,
+        cookie_headers,
+        mock_user_db,
+        user: UserDB,
+        superuser: UserDB,
+    ):
+        client = test_app_client_user_cache
+        response = await client.get("/me", headers=cookie_headers(user))
+        assert response.status_code == status.HTTP_200_OK
+
+        response = await client.delete(f"/{user.id}", headers=cookie_headers(superuser))
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+        get = mock_user_db.get
+
+        async def get_not_deleted(id):
+            return None if id == user.id else await get(id)
+
+        monkeypatch.setattr(mock_user_db, "get", get_not_deleted)
+        response = await client.get("/me", headers=cookie_headers(user))
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
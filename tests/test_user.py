@@ -56,8 +56,9 @@ class TestCreateUser:
 @pytest.fixture
 def verify_user(
     mock_user_db,
+    user_loader,
 ) -> VerifyUserProtocol:
-    return get_verify_user(mock_user_db)
+    return get_verify_user(mock_user_db, user_loader)
 
 
 @pytest.mark.asyncio
@@ -66,6 +67,8 @@ class TestVerifyUser:
         with pytest.raises(UserAlreadyVerified):
             await verify_user(verified_user)
 
-    async def test_non_verified_user(self, verify_user, user):
+    async def test_non_verified_user(self, mocker, verify_user, user, user_loader):
+        mocker.spy(user_loader, "invalidate")
         user = await verify_user(user)
         assert user.is_verified
+        user_loader.invalidate.assert_called_once_with(user.id)